@@ -1,6 +1,22 @@
+from pydantic_cache.admission import AdmissionPolicy, Doorkeeper, MaxSize, MinComputeDuration
 from pydantic_cache.backend import AsyncBackend, Backend, DiskBackend
 from pydantic_cache.decorator import PydanticCacheError, cache, disk_cache
+from pydantic_cache.entry import Entry
+from pydantic_cache.scope import cache_scope
 
 __version__ = "0.1.0"
 
-__all__ = ["AsyncBackend", "Backend", "DiskBackend", "PydanticCacheError", "cache", "disk_cache"]
+__all__ = [
+    "AdmissionPolicy",
+    "AsyncBackend",
+    "Backend",
+    "DiskBackend",
+    "Doorkeeper",
+    "Entry",
+    "MaxSize",
+    "MinComputeDuration",
+    "PydanticCacheError",
+    "cache",
+    "cache_scope",
+    "disk_cache",
+]
@@ -0,0 +1,3 @@
+from pydantic_cache.cli import main
+
+raise SystemExit(main())
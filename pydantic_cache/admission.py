@@ -0,0 +1,66 @@
+from datetime import timedelta
+from hashlib import blake2b
+from threading import Lock
+
+from pydantic_cache.entry import Entry
+
+
+class AdmissionPolicy:
+    def admit(self, key: str, entry: Entry) -> bool:
+        raise NotImplementedError  # pragma: no cover
+
+
+class MaxSize(AdmissionPolicy):
+    """Reject entries whose serialized result is larger than ``size`` bytes."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    def admit(self, key: str, entry: Entry) -> bool:
+        return entry.size <= self.size
+
+
+class MinComputeDuration(AdmissionPolicy):
+    """Reject results which were computed faster than ``duration``, e.g. the backend's round trip time."""
+
+    def __init__(self, duration: timedelta) -> None:
+        self.duration = duration
+
+    def admit(self, key: str, entry: Entry) -> bool:
+        return entry.compute_duration >= self.duration
+
+
+class Doorkeeper(AdmissionPolicy):
+    """Only admit keys which have been seen before, as in TinyLFU.
+
+    Sightings are tracked in a Bloom filter, which is reset after ``capacity`` insertions so that the policy adapts to
+    changing workloads.
+    """
+
+    _hashes = 4
+    _bits_per_key = 8
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self._size = capacity * self._bits_per_key
+        self._bits = bytearray(self._size // 8 + 1)
+        self._insertions = 0
+        self._lock = Lock()
+
+    def admit(self, key: str, entry: Entry) -> bool:
+        digest = blake2b(key.encode("utf-8"), digest_size=4 * self._hashes).digest()
+        positions = [
+            int.from_bytes(digest[index : index + 4], "big") % self._size for index in range(0, len(digest), 4)
+        ]
+        with self._lock:
+            if all(self._bits[position // 8] & (1 << (position % 8)) for position in positions):
+                return True
+            if self._insertions >= self.capacity:
+                self._bits = bytearray(len(self._bits))
+                self._insertions = 0
+            for position in positions:
+                self._bits[position // 8] |= 1 << (position % 8)
+            self._insertions += 1
+            return False
@@ -1,5 +1,19 @@
 from pydantic_cache.backend.base import AsyncBackend, Backend
+from pydantic_cache.backend.circuit_breaker import AsyncCircuitBreakerBackend, CircuitBreakerBackend
 from pydantic_cache.backend.disk import DiskBackend
 from pydantic_cache.backend.redis import RedisBackend
+from pydantic_cache.backend.sharded import ShardedBackend
+from pydantic_cache.backend.tracing import TracingBackend
+from pydantic_cache.backend.write_behind import WriteBehindBackend
 
-__all__ = ["AsyncBackend", "Backend", "DiskBackend", "RedisBackend"]
+__all__ = [
+    "AsyncBackend",
+    "AsyncCircuitBreakerBackend",
+    "Backend",
+    "CircuitBreakerBackend",
+    "DiskBackend",
+    "RedisBackend",
+    "ShardedBackend",
+    "TracingBackend",
+    "WriteBehindBackend",
+]
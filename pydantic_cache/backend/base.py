@@ -1,3 +1,6 @@
+from collections.abc import Iterable, Mapping
+
+
 class Backend:
     def get(self, key: str) -> str:
         raise NotImplementedError  # pragma: no cover
@@ -5,6 +8,27 @@ class Backend:
     def write(self, key: str, value: str) -> None:
         raise NotImplementedError  # pragma: no cover
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """Fetch several keys at once, omitting any cache misses from the result.
+
+        Backends which support batched reads should override this.
+        """
+        results: dict[str, str] = {}
+        for key in keys:
+            try:
+                results[key] = self.get(key)
+            except KeyError:
+                continue
+        return results
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        """Write several entries at once.
+
+        Backends which support batched writes should override this.
+        """
+        for key, value in items.items():
+            self.write(key, value)
+
 
 class AsyncBackend:
     async def get(self, key: str) -> str:
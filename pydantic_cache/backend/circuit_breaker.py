@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future
+from datetime import timedelta
+from queue import SimpleQueue
+from threading import Lock, Thread
+from typing import Any, TypeVar
+
+from pydantic_cache.backend.base import AsyncBackend, Backend
+
+logger = logging.getLogger(__name__)
+
+Result = TypeVar("Result")
+
+
+class CircuitBreakerBackend(Backend):
+    """Wrap a backend so that failures degrade to cache misses rather than errors.
+
+    Reads which raise, or take longer than ``timeout``, are treated as misses, and failed writes are logged and
+    discarded. After ``failure_threshold`` consecutive failures the backend is bypassed entirely for ``cooldown``.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        timeout: timedelta | None = None,
+        failure_threshold: int = 5,
+        cooldown: timedelta = timedelta(seconds=30),
+    ) -> None:
+        self.backend = backend
+        self.timeout = timeout
+        self.circuit = Circuit(failure_threshold, cooldown)
+        self._executor = DaemonExecutor() if timeout is not None else None
+
+    def get(self, key: str) -> str:
+        if not self.circuit.allow():
+            raise KeyError(key)
+        try:
+            result = self._call(self.backend.get, key)
+        except KeyError:
+            self.circuit.record_success()
+            raise
+        except Exception as exc:
+            self._record_failure("get", exc)
+            raise KeyError(key) from exc
+        self.circuit.record_success()
+        return result
+
+    def write(self, key: str, value: str) -> None:
+        if not self.circuit.allow():
+            return
+        try:
+            self._call(self.backend.write, key, value)
+        except Exception as exc:
+            self._record_failure("write", exc)
+            return
+        self.circuit.record_success()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        if not self.circuit.allow():
+            return {}
+        try:
+            results = self._call(self.backend.get_many, list(keys))
+        except Exception as exc:
+            self._record_failure("get_many", exc)
+            return {}
+        self.circuit.record_success()
+        return results
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        if not self.circuit.allow():
+            return
+        try:
+            self._call(self.backend.write_many, items)
+        except Exception as exc:
+            self._record_failure("write_many", exc)
+            return
+        self.circuit.record_success()
+
+    def _call(self, method: Callable[..., Result], *args: object) -> Result:
+        if self._executor is None or self.timeout is None:
+            return method(*args)
+        future = self._executor.submit(method, *args)
+        try:
+            return future.result(timeout=self.timeout.total_seconds())
+        finally:
+            # Drop the call if it is still queued behind hung calls.
+            future.cancel()
+
+    def _record_failure(self, operation: str, exc: Exception) -> None:
+        self.circuit.record_failure()
+        logger.warning("Cache backend %s failed, falling back to direct computation: %r", operation, exc)
+
+
+class AsyncCircuitBreakerBackend(AsyncBackend):
+    """Asynchronous equivalent of ``CircuitBreakerBackend``."""
+
+    def __init__(
+        self,
+        backend: AsyncBackend,
+        timeout: timedelta | None = None,
+        failure_threshold: int = 5,
+        cooldown: timedelta = timedelta(seconds=30),
+    ) -> None:
+        self.backend = backend
+        self.timeout = timeout
+        self.circuit = Circuit(failure_threshold, cooldown)
+
+    async def get(self, key: str) -> str:
+        if not self.circuit.allow():
+            raise KeyError(key)
+        try:
+            result = await asyncio.wait_for(self.backend.get(key), timeout=self._timeout_seconds)
+        except KeyError:
+            self.circuit.record_success()
+            raise
+        except Exception as exc:
+            self._record_failure("get", exc)
+            raise KeyError(key) from exc
+        self.circuit.record_success()
+        return result
+
+    async def write(self, key: str, value: str) -> None:
+        if not self.circuit.allow():
+            return
+        try:
+            await asyncio.wait_for(self.backend.write(key, value), timeout=self._timeout_seconds)
+        except Exception as exc:
+            self._record_failure("write", exc)
+            return
+        self.circuit.record_success()
+
+    @property
+    def _timeout_seconds(self) -> float | None:
+        return self.timeout.total_seconds() if self.timeout is not None else None
+
+    def _record_failure(self, operation: str, exc: Exception) -> None:
+        self.circuit.record_failure()
+        logger.warning("Cache backend %s failed, falling back to direct computation: %r", operation, exc)
+
+
+class Circuit:
+    """Track consecutive failures, opening the circuit once ``failure_threshold`` is reached.
+
+    Once ``cooldown`` has elapsed, a single probe call is allowed through while other calls continue to bypass the
+    backend. If the probe succeeds the circuit closes, otherwise it re-opens for another ``cooldown``.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown: timedelta) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started_at: float | None = None
+        self._lock = Lock()
+
+    def allow(self) -> bool:
+        """Return whether a call should be made to the backend."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.cooldown.total_seconds():
+                return False
+            # A probe whose outcome was never recorded (e.g. a cancelled task) is abandoned after a further cool-down.
+            if self._probe_started_at is not None and now - self._probe_started_at < self.cooldown.total_seconds():
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+
+class DaemonExecutor:
+    """Minimal thread pool with daemon workers, so that calls hung on a backend don't block interpreter exit."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers = max_workers
+        self._queue: SimpleQueue[tuple[Future, Callable[..., Any], tuple[Any, ...]]] = SimpleQueue()
+        self._workers: list[Thread] = []
+        self._lock = Lock()
+
+    def submit(self, method: Callable[..., Result], *args: Any) -> "Future[Result]":
+        future: Future[Result] = Future()
+        self._queue.put((future, method, args))
+        with self._lock:
+            if not self._workers:
+                for index in range(self.max_workers):
+                    worker = Thread(target=self._run, name=f"pydantic-cache-{index}", daemon=True)
+                    worker.start()
+                    self._workers.append(worker)
+        return future
+
+    def _run(self) -> None:
+        while True:
+            future, method, args = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(method(*args))
+            except BaseException as exc:
+                future.set_exception(exc)
@@ -1,8 +1,9 @@
-import json
-from datetime import datetime, timedelta
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from pydantic_cache.backend.base import Backend
+from pydantic_cache.entry import Entry
 
 
 class DiskBackend(Backend):
@@ -14,20 +15,23 @@ class DiskBackend(Backend):
         path = self.directory / f"{key}.json"
         if not path.exists():
             raise KeyError(key)
-        content = json.loads(path.read_text(encoding="utf-8"))
-        timestamp = datetime.fromisoformat(content["timestamp"])
-        if datetime.now() - timestamp > self.ttl:
+        value = path.read_text(encoding="utf-8")
+        try:
+            entry = Entry.loads(value)
+        except ValueError:
+            # Values not written by `cache` carry no metadata, so fall back to the time the file was written.
+            created_at = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+        else:
+            if entry.is_expired():
+                raise KeyError(key)
+            created_at = entry.created_at
+        if datetime.now(timezone.utc) - created_at > self.ttl:
             raise KeyError(key)
-        return content["value"]
+        return value
 
     def write(self, key: str, value: str) -> None:
-        path = self.directory / f"{key}.json"
-        timestamp = datetime.now()
-        path.write_text(
-            json.dumps(
-                {
-                    "timestamp": timestamp.isoformat(),
-                    "value": value,
-                }
-            )
-        )
+        self.write_many({key: value})
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        for key, value in items.items():
+            (self.directory / f"{key}.json").write_text(value, encoding="utf-8")
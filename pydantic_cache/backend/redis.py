@@ -1,4 +1,5 @@
 import typing
+from collections.abc import Iterable, Mapping
 from datetime import timedelta
 
 if typing.TYPE_CHECKING:
@@ -8,15 +9,37 @@ from pydantic_cache.backend.base import Backend
 
 
 class RedisBackend(Backend):
-    def __init__(self, redis: "Redis", ttl: timedelta):
+    def __init__(self, redis: "Redis", ttl: timedelta, namespace: str | None = None):
         self.redis = redis
         self.ttl = ttl
+        self.namespace = namespace
 
     def get(self, key: str) -> str:
-        result = self.redis.get(key)
+        result = self.redis.get(self._key(key))
         if result is None:
             raise KeyError(key)
         return result
 
     def write(self, key: str, value: str) -> None:
-        self.redis.set(key, value, ex=self.ttl)
+        self.redis.set(self._key(key), value, ex=self.ttl)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        names = [self._key(key) for key in keys]
+        # Redis Cluster rejects MGET across hash slots, so use the cluster client's per-slot batching if available.
+        mget = getattr(self.redis, "mget_nonatomic", self.redis.mget)
+        results: list[typing.Any] = mget(names)
+        return {key: result for key, result in zip(keys, results) if result is not None}
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        with self.redis.pipeline(transaction=False) as pipeline:
+            for key, value in items.items():
+                pipeline.set(self._key(key), value, ex=self.ttl)
+            pipeline.execute()
+
+    def _key(self, key: str) -> str:
+        if self.namespace is None:
+            return key
+        return f"{self.namespace}:{key}"
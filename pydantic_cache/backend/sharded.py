@@ -0,0 +1,98 @@
+import logging
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from hashlib import sha256
+
+from pydantic_cache.backend.base import Backend
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedBackend(Backend):
+    """Spread keys across several backends using jump consistent hashing.
+
+    Keys containing a Redis Cluster style hash tag (e.g. ``"user:{42}:profile"``) are sharded on the tag alone, so
+    related keys land on the same shard. The shard is chosen before any namespace is applied by the shard itself, and
+    keys generated by ``cache`` never contain a hash tag, so tags only affect keys used with the backend directly.
+
+    If ``replicas`` are provided, there must be one per shard: reads are served by the replica, falling back to the
+    primary on a miss or if the replica fails, while writes always go to the primary. Batched reads and writes are
+    grouped per shard, and the shards are called sequentially.
+    """
+
+    def __init__(self, shards: Sequence[Backend], replicas: Sequence[Backend] | None = None) -> None:
+        if not shards:
+            raise ValueError("At least one shard is required.")
+        if replicas is not None and len(replicas) != len(shards):
+            raise ValueError("The number of replicas must match the number of shards.")
+        self.shards = list(shards)
+        self.replicas = list(replicas) if replicas is not None else None
+
+    def get(self, key: str) -> str:
+        index = self.shard_index(key)
+        if self.replicas is not None:
+            try:
+                return self.replicas[index].get(key)
+            except KeyError:
+                pass
+            except Exception as exc:
+                _log_replica_failure("get", index, exc)
+        return self.shards[index].get(key)
+
+    def write(self, key: str, value: str) -> None:
+        self.shards[self.shard_index(key)].write(key, value)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        keys_by_shard: dict[int, list[str]] = defaultdict(list)
+        for key in keys:
+            keys_by_shard[self.shard_index(key)].append(key)
+        results: dict[str, str] = {}
+        for index, shard_keys in keys_by_shard.items():
+            if self.replicas is not None:
+                try:
+                    found = self.replicas[index].get_many(shard_keys)
+                except Exception as exc:
+                    _log_replica_failure("get_many", index, exc)
+                    found = {}
+                results.update(found)
+                shard_keys = [key for key in shard_keys if key not in found]
+                if not shard_keys:
+                    continue
+            results.update(self.shards[index].get_many(shard_keys))
+        return results
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        items_by_shard: dict[int, dict[str, str]] = defaultdict(dict)
+        for key, value in items.items():
+            items_by_shard[self.shard_index(key)][key] = value
+        for index, shard_items in items_by_shard.items():
+            self.shards[index].write_many(shard_items)
+
+    def shard_index(self, key: str) -> int:
+        digest = sha256(_hash_tag(key).encode("utf-8")).digest()
+        return _jump_hash(int.from_bytes(digest[:8], "big"), len(self.shards))
+
+
+def _log_replica_failure(operation: str, index: int, exc: Exception) -> None:
+    logger.warning("Replica %s failed for shard %d, falling back to the primary: %r", operation, index, exc)
+
+
+def _hash_tag(key: str) -> str:
+    """Extract the portion of a key used for sharding, following the Redis Cluster hash tag rules."""
+    start = key.find("{")
+    if start == -1:
+        return key
+    end = key.find("}", start + 1)
+    if end == -1 or end == start + 1:
+        return key
+    return key[start + 1 : end]
+
+
+def _jump_hash(key: int, num_buckets: int) -> int:
+    """Jump consistent hash (Lamping & Veach, 2014)."""
+    bucket, jump = -1, 0
+    while jump < num_buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
@@ -0,0 +1,54 @@
+import weakref
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from threading import Lock
+
+from pydantic_cache.backend.base import Backend
+
+
+class TracingBackend(Backend):
+    """Wrap a backend, recording each key read to a trace file, one per line.
+
+    The trace file is kept open and written through a buffer, which is flushed when the backend is closed, garbage
+    collected or the interpreter exits. Keys read after closing are not recorded. The trace can be replayed with ``python -m pydantic_cache simulate`` to
+    estimate hit rates.
+    """
+
+    def __init__(self, backend: Backend, path: Path | str) -> None:
+        self.backend = backend
+        self.path = Path(path)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._lock = Lock()
+        self._finalizer = weakref.finalize(self, self._file.close)
+
+    def get(self, key: str) -> str:
+        self._record([key])
+        return self.backend.get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        keys = list(keys)
+        self._record(keys)
+        return self.backend.get_many(keys)
+
+    def write(self, key: str, value: str) -> None:
+        self.backend.write(key, value)
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        self.backend.write_many(items)
+
+    def flush(self) -> None:
+        """Write any buffered keys to the trace file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the trace file."""
+        with self._lock:
+            self._finalizer()
+
+    def _record(self, keys: list[str]) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.writelines(f"{key}\n" for key in keys)
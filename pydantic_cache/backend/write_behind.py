@@ -0,0 +1,134 @@
+import logging
+import weakref
+from collections.abc import Iterable, Mapping
+from datetime import timedelta
+from threading import Condition, Event, Lock, Thread, current_thread
+
+from pydantic_cache.backend.base import Backend
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBackend(Backend):
+    """Wrap a backend so that writes are buffered and flushed in batches by a background thread.
+
+    Writes to the same key are coalesced while pending, and pending values are visible to reads. The buffer is flushed
+    every ``flush_interval``, as soon as it holds ``max_pending`` entries, and when the backend is closed, garbage
+    collected or the interpreter exits. Writers only block if the buffer is full while a previous batch is still being
+    flushed. Failed flushes are logged, and the batch is discarded.
+    """
+
+    def __init__(
+        self,
+        backend: Backend,
+        max_pending: int = 1000,
+        flush_interval: timedelta = timedelta(seconds=1),
+    ) -> None:
+        if max_pending <= 0:
+            raise ValueError("max_pending must be positive.")
+        if flush_interval <= timedelta():
+            raise ValueError("flush_interval must be positive.")
+        self.backend = backend
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        # The background thread and exit handler only reference the buffer, so that the backend can be garbage
+        # collected, which stops the thread.
+        self._buffer = _WriteBuffer(backend, max_pending, flush_interval)
+        thread = Thread(target=self._buffer.run, name="pydantic-cache-write-behind", daemon=True)
+        thread.start()
+        self._finalizer = weakref.finalize(self, self._buffer.close, thread)
+
+    def get(self, key: str) -> str:
+        try:
+            return self._buffer.get(key)
+        except KeyError:
+            return self.backend.get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        results: dict[str, str] = {}
+        missing: list[str] = []
+        for key in keys:
+            try:
+                results[key] = self._buffer.get(key)
+            except KeyError:
+                missing.append(key)
+        if missing:
+            results.update(self.backend.get_many(missing))
+        return results
+
+    def write(self, key: str, value: str) -> None:
+        self.write_many({key: value})
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        if not self._buffer.add(items):
+            self.backend.write_many(items)
+
+    def flush(self) -> None:
+        """Write all pending entries to the underlying backend."""
+        self._buffer.flush()
+
+    def close(self) -> None:
+        """Stop the background thread and flush any pending entries."""
+        self._finalizer()
+
+
+class _WriteBuffer:
+    def __init__(self, backend: Backend, max_pending: int, flush_interval: timedelta) -> None:
+        self.backend = backend
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self._pending: dict[str, str] = {}
+        self._flushing: dict[str, str] = {}
+        self._condition = Condition()
+        self._flush_lock = Lock()
+        self._wake = Event()
+        self._closed = Event()
+
+    def get(self, key: str) -> str:
+        with self._condition:
+            if key in self._pending:
+                return self._pending[key]
+            return self._flushing[key]
+
+    def add(self, items: Mapping[str, str]) -> bool:
+        """Buffer ``items``, returning ``False`` if the buffer is closed."""
+        with self._condition:
+            while not self._closed.is_set() and len(self._pending) >= self.max_pending:
+                self._wake.set()
+                self._condition.wait()
+            if self._closed.is_set():
+                return False
+            self._pending.update(items)
+            if len(self._pending) >= self.max_pending:
+                self._wake.set()
+        return True
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._condition:
+                if not self._pending:
+                    return
+                self._flushing, self._pending = self._pending, {}
+                self._condition.notify_all()
+            try:
+                self.backend.write_many(self._flushing)
+            except Exception as exc:
+                logger.warning("Failed to flush %d pending cache writes: %r", len(self._flushing), exc)
+            finally:
+                with self._condition:
+                    self._flushing = {}
+
+    def run(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval.total_seconds())
+            self._wake.clear()
+            self.flush()
+
+    def close(self, thread: Thread) -> None:
+        with self._condition:
+            self._closed.set()
+            self._condition.notify_all()
+        self._wake.set()
+        if thread is not current_thread():
+            thread.join()
+        self.flush()
@@ -0,0 +1,238 @@
+"""Inspect cache backends, prune expired entries and simulate hit rates from access traces."""
+
+import argparse
+import heapq
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from pydantic_cache.entry import Entry
+from pydantic_cache.simulation import POLICIES, simulate
+
+if TYPE_CHECKING:
+    from redis import Redis  # pragma: no cover
+
+
+class Record(NamedTuple):
+    key: str
+    size: int
+    created_at: datetime | None
+    expires_at: datetime | None
+
+
+SIZE_BUCKETS = [
+    ("< 1 KB", 1024),
+    ("< 10 KB", 10 * 1024),
+    ("< 100 KB", 100 * 1024),
+    ("< 1 MB", 1024 * 1024),
+    (">= 1 MB", math.inf),
+]
+
+DURATION_BUCKETS = [
+    ("< 1 minute", 60),
+    ("< 1 hour", 60 * 60),
+    ("< 1 day", 24 * 60 * 60),
+    ("< 1 week", 7 * 24 * 60 * 60),
+    (">= 1 week", math.inf),
+]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pydantic_cache", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    inspect_parser = commands.add_parser("inspect", help="Summarise the entries in a cache.")
+    _add_source_arguments(inspect_parser)
+    inspect_parser.add_argument("--top", type=int, default=10, help="Number of largest entries to list.")
+
+    prune_parser = commands.add_parser("prune", help="Delete expired entries from a cache.")
+    _add_source_arguments(prune_parser)
+
+    simulate_parser = commands.add_parser("simulate", help="Replay an access trace to estimate hit rates.")
+    simulate_parser.add_argument("trace", type=Path, help="File containing one accessed key per line.")
+    simulate_parser.add_argument(
+        "--capacity", type=_positive_int, nargs="+", required=True, help="Cache capacities to simulate."
+    )
+    simulate_parser.add_argument("--policy", choices=sorted(POLICIES), nargs="+", default=["lru"])
+
+    args = parser.parse_args(argv)
+    if args.command == "simulate":
+        _simulate(args.trace, args.capacity, args.policy)
+        return 0
+
+    if args.ttl is not None and args.disk is None:
+        parser.error("--ttl only applies to --disk, as redis expires entries itself.")
+    ttl = timedelta(seconds=args.ttl) if args.ttl is not None else None
+    if args.disk is not None:
+        records = list(_scan_disk(args.disk, ttl))
+    else:
+        try:
+            from redis import Redis
+        except ImportError:  # pragma: no cover
+            parser.error("Inspecting redis requires the redis extra: pip install pydantic-cache[redis]")
+        redis = Redis.from_url(args.redis, decode_responses=True)
+        records = list(_scan_redis(redis, args.namespace))
+
+    if args.command == "inspect":
+        _report(records, args.top)
+        return 0
+
+    expired = [record.key for record in records if _is_expired(record)]
+    if args.disk is not None:
+        for key in expired:
+            (args.disk / f"{key}.json").unlink(missing_ok=True)
+    elif expired:
+        redis.delete(*(_redis_key(key, args.namespace) for key in expired))
+    print(f"Pruned {len(expired)} expired entries.")
+    return 0
+
+
+def _add_source_arguments(parser: argparse.ArgumentParser) -> None:
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--disk", type=Path, help="Directory of a DiskBackend.")
+    source.add_argument("--redis", help="URL of a redis server, e.g. redis://localhost:6379/0.")
+    parser.add_argument("--namespace", help="Namespace of a RedisBackend.")
+    parser.add_argument("--ttl", type=_positive_float, help="TTL of a DiskBackend, in seconds.")
+
+
+def _positive_int(value: str) -> int:
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result <= 0:
+        raise argparse.ArgumentTypeError(f"{value!r} must be a positive integer")
+    return result
+
+
+def _positive_float(value: str) -> float:
+    try:
+        result = float(value)
+    except ValueError:
+        result = 0.0
+    if not result > 0:
+        raise argparse.ArgumentTypeError(f"{value!r} must be a positive number")
+    return result
+
+
+def _scan_disk(directory: Path, ttl: timedelta | None) -> Iterator[Record]:
+    for path in directory.glob("*.json"):
+        value = path.read_text(encoding="utf-8")
+        entry = _parse_entry(value)
+        if entry is None:
+            continue
+        yield Record(
+            key=path.stem,
+            size=len(value.encode("utf-8")),
+            created_at=entry.created_at,
+            expires_at=_earliest(entry.created_at + ttl if ttl is not None else None, entry.expires_at),
+        )
+
+
+def _scan_redis(redis: "Redis", namespace: str | None, batch_size: int = 1000) -> Iterator[Record]:
+    names = redis.scan_iter(match=_redis_key("*", namespace), count=batch_size)
+    while batch := list(islice(names, batch_size)):
+        with redis.pipeline(transaction=False) as pipeline:
+            for name in batch:
+                pipeline.get(name)
+                pipeline.pttl(name)
+            # Keys which aren't strings, e.g. hashes sharing the database, fail with WRONGTYPE and are skipped.
+            responses = pipeline.execute(raise_on_error=False)
+        now = datetime.now(timezone.utc)
+        for name, value, ttl in zip(batch, responses[::2], responses[1::2]):
+            if value is None or isinstance(value, Exception) or isinstance(ttl, Exception):
+                continue
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            entry = _parse_entry(value)
+            if entry is None:
+                continue
+            yield Record(
+                key=name.removeprefix(_redis_key("", namespace)),
+                size=len(value.encode("utf-8")),
+                created_at=entry.created_at,
+                expires_at=_earliest(now + timedelta(milliseconds=ttl) if ttl >= 0 else None, entry.expires_at),
+            )
+
+
+def _redis_key(key: str, namespace: str | None) -> str:
+    return f"{namespace}:{key}" if namespace is not None else key
+
+
+def _parse_entry(value: str) -> Entry | None:
+    try:
+        return Entry.loads(value)
+    except ValueError:
+        return None
+
+
+def _earliest(*expiries: datetime | None) -> datetime | None:
+    return min((expiry for expiry in expiries if expiry is not None), default=None)
+
+
+def _is_expired(record: Record) -> bool:
+    return record.expires_at is not None and record.expires_at <= datetime.now(timezone.utc)
+
+
+def _report(records: list[Record], top: int) -> None:
+    now = datetime.now(timezone.utc)
+    print(f"Entries: {len(records)}")
+    print(f"Total size: {_format_size(sum(record.size for record in records))}")
+
+    _print_histogram("Size", [_bucket(record.size, SIZE_BUCKETS) for record in records])
+    _print_histogram(
+        "Age",
+        [
+            _bucket((now - record.created_at).total_seconds(), DURATION_BUCKETS)
+            for record in records
+            if record.created_at is not None
+        ],
+    )
+    ttls = []
+    for record in records:
+        if record.expires_at is None:
+            ttls.append("no expiry")
+        elif _is_expired(record):
+            ttls.append("expired")
+        else:
+            ttls.append(_bucket((record.expires_at - now).total_seconds(), DURATION_BUCKETS))
+    _print_histogram("Time to live", ttls)
+
+    print("\nLargest entries")
+    for record in heapq.nlargest(top, records, key=lambda record: record.size):
+        print(f"  {_format_size(record.size):>10}  {record.key}")
+
+
+def _bucket(value: float, buckets: list[tuple[str, float]]) -> str:
+    return next(label for label, upper in buckets if value < upper)
+
+
+def _print_histogram(title: str, labels: Iterable[str]) -> None:
+    counts: dict[str, int] = {}
+    for label in labels:
+        counts[label] = counts.get(label, 0) + 1
+    print(f"\n{title}")
+    order = [label for label, _ in SIZE_BUCKETS + DURATION_BUCKETS] + ["expired", "no expiry"]
+    largest = max(counts.values(), default=0)
+    for label in sorted(counts, key=order.index):
+        bar = "#" * math.ceil(40 * counts[label] / largest)
+        print(f"  {label:<12} {counts[label]:>8}  {bar}")
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _simulate(trace_path: Path, capacities: list[int], policies: list[str]) -> None:
+    trace = trace_path.read_text(encoding="utf-8").split()
+    print(f"{'policy':<8}{'capacity':>10}{'hit rate':>10}")
+    for policy in policies:
+        for capacity in capacities:
+            print(f"{policy:<8}{capacity:>10}{simulate(trace, capacity, policy):>10.1%}")
@@ -1,7 +1,8 @@
 import asyncio
 import inspect
 import json
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
 from datetime import timedelta
 from functools import wraps
 from hashlib import sha256
@@ -11,7 +12,11 @@ from typing import ParamSpec, TypeVar
 from pydantic import PydanticSchemaGenerationError, TypeAdapter
 from pydantic_core import to_jsonable_python
 
+from pydantic_cache.admission import AdmissionPolicy
 from pydantic_cache.backend import AsyncBackend, Backend, DiskBackend
+from pydantic_cache.entry import Entry
+from pydantic_cache.fingerprint import ArgumentFingerprints
+from pydantic_cache.scope import get_scope
 
 
 class PydanticCacheError(Exception):
@@ -23,7 +28,10 @@ Return = TypeVar("Return")
 
 
 def cache(
-    backend: Backend | AsyncBackend | Callable[[], Backend | AsyncBackend]
+    backend: Backend | AsyncBackend | Callable[[], Backend | AsyncBackend],
+    ttl: timedelta | None = None,
+    admission: Sequence[AdmissionPolicy] = (),
+    memoize_arguments: bool = False,
 ) -> Callable[[Callable[Params, Return]], Callable[Params, Return]]:
     def get_backend() -> Backend | AsyncBackend | AsyncBackend:
         if isinstance(backend, (Backend, AsyncBackend)) or not callable(backend):
@@ -45,49 +53,92 @@ def cache(
                 "Pydantic"
             ) from exc
 
+        fingerprints = ArgumentFingerprints() if memoize_arguments else None
+
         def get_key(*args: Params.args, **kwargs: Params.kwargs) -> str:
+            arguments = function_signature.bind(*args, **kwargs).arguments
+            if fingerprints is not None:
+                # Tag each argument, so that a digest can't collide with an argument serialized to the same string.
+                for name, value in arguments.items():
+                    digest = fingerprints.fingerprint(value)
+                    arguments[name] = ("value", value) if digest is None else ("digest", digest)
             return sha256(
                 json.dumps(
-                    function_signature.bind(*args, **kwargs).arguments,
+                    arguments,
                     default=to_jsonable_python,
                     sort_keys=True,
                 ).encode("utf-8")
             ).hexdigest()
 
+        def load(key: str, raw: str) -> Return:
+            try:
+                entry = Entry.loads(raw)
+            except ValueError as exc:
+                # Entries from an older or unrecognised schema version are treated as a miss.
+                raise KeyError(key) from exc
+            if entry.is_expired():
+                raise KeyError(key)
+            return result_adapter.validate_python(entry.value)
+
+        def dump(key: str, result: Return, compute_duration: float) -> str | None:
+            entry = Entry.create(result, compute_duration=timedelta(seconds=compute_duration), ttl=ttl)
+            if not all(policy.admit(key, entry) for policy in admission):
+                return None
+            return entry.dumps()
+
         if asyncio.iscoroutinefunction(function):
 
             @wraps(function)
             async def wrapper(*args, **kwargs):
-                backend = get_backend()
                 key = get_key(*args, **kwargs)
+                scope = get_scope()
+                if scope is not None and (wrapper, key) in scope:
+                    return scope[wrapper, key]
+                backend = get_backend()
                 if isinstance(backend, AsyncBackend):
                     try:
-                        return result_adapter.validate_python(json.loads(await backend.get(key)))
+                        result = load(key, await backend.get(key))
                     except KeyError:
+                        start = time.perf_counter()
                         result = await function(*args, **kwargs)
-                        await backend.write(key, json.dumps(result, default=to_jsonable_python))
-                        return result
-                try:
-                    return result_adapter.validate_python(json.loads(backend.get(key)))
-                except KeyError:
-                    result = await function(*args, **kwargs)
-                    backend.write(key, json.dumps(result, default=to_jsonable_python))
-                    return result
+                        value = dump(key, result, time.perf_counter() - start)
+                        if value is not None:
+                            await backend.write(key, value)
+                else:
+                    try:
+                        result = load(key, backend.get(key))
+                    except KeyError:
+                        start = time.perf_counter()
+                        result = await function(*args, **kwargs)
+                        value = dump(key, result, time.perf_counter() - start)
+                        if value is not None:
+                            backend.write(key, value)
+                if scope is not None:
+                    scope[wrapper, key] = result
+                return result
 
         else:
 
             @wraps(function)
             def wrapper(*args: Params.args, **kwargs: Params.kwargs) -> Return:
+                key = get_key(*args, **kwargs)
+                scope = get_scope()
+                if scope is not None and (wrapper, key) in scope:
+                    return scope[wrapper, key]
                 backend = get_backend()
                 if isinstance(backend, AsyncBackend):
                     raise PydanticCacheError("Can't use an async cache backend on a synchronous function.")
-                key = get_key(*args, **kwargs)
                 try:
-                    return result_adapter.validate_python(json.loads(backend.get(key)))
+                    result = load(key, backend.get(key))
                 except KeyError:
+                    start = time.perf_counter()
                     result = function(*args, **kwargs)
-                    backend.write(key, json.dumps(result, default=to_jsonable_python))
-                    return result
+                    value = dump(key, result, time.perf_counter() - start)
+                    if value is not None:
+                        backend.write(key, value)
+                if scope is not None:
+                    scope[wrapper, key] = result
+                return result
 
         return wrapper
 
@@ -0,0 +1,49 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Final, Literal
+
+from pydantic import BaseModel, PrivateAttr
+from pydantic_core import to_jsonable_python
+
+SCHEMA_VERSION: Final = 2
+
+
+class Entry(BaseModel):
+    """Envelope stored in cache backends, embedding a serialized result alongside metadata."""
+
+    schema_version: Literal[2] = SCHEMA_VERSION
+    created_at: datetime
+    expires_at: datetime | None = None
+    compute_duration: timedelta
+    size: int
+    value: Any
+
+    _payload: str | None = PrivateAttr(default=None)
+
+    @classmethod
+    def create(cls, value: Any, compute_duration: timedelta, ttl: timedelta | None = None) -> "Entry":
+        payload = json.dumps(value, default=to_jsonable_python)
+        created_at = datetime.now(timezone.utc)
+        entry = cls(
+            created_at=created_at,
+            expires_at=created_at + ttl if ttl is not None else None,
+            compute_duration=compute_duration,
+            size=len(payload.encode("utf-8")),
+            value=value,
+        )
+        entry._payload = payload
+        return entry
+
+    @classmethod
+    def loads(cls, raw: str | bytes) -> "Entry":
+        """Parse a serialized entry, raising ``ValueError`` if it is not a valid envelope."""
+        return cls.model_validate(json.loads(raw))
+
+    def dumps(self) -> str:
+        # The value is embedded as JSON, rather than as an escaped string, and is only serialized once.
+        payload = self._payload if self._payload is not None else json.dumps(self.value, default=to_jsonable_python)
+        metadata = self.model_dump_json(exclude={"value"})
+        return f'{metadata[:-1]},"value":{payload}}}'
+
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and datetime.now(timezone.utc) >= self.expires_at
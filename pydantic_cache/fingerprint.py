@@ -0,0 +1,83 @@
+import json
+import weakref
+from collections import OrderedDict
+from hashlib import sha256
+from threading import RLock
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+
+class ArgumentFingerprints:
+    """Memoize digests of immutable arguments by identity, so that repeated calls with the same objects skip
+    re-serializing them.
+
+    Only hashable values are memoized, so that digests never go stale. Frozen pydantic models are tracked with weak
+    references, and forgotten once garbage collected. Immutable builtins (``str``, ``bytes``, ``tuple`` and
+    ``frozenset``) do not support weak references, so the ``maxsize`` most recently used are held strongly instead.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._weak: dict[int, tuple[weakref.ref, str]] = {}
+        self._strong: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+        # Re-entrant, as weak reference callbacks may fire during garbage collection while the lock is held.
+        self._lock = RLock()
+
+    def fingerprint(self, value: Any) -> str | None:
+        """Return the digest of ``value``, or ``None`` if it is not eligible for memoization."""
+        if isinstance(value, BaseModel) and value.model_config.get("frozen"):
+            return self._fingerprint_weak(value)
+        if isinstance(value, (str, bytes, tuple, frozenset)):
+            return self._fingerprint_strong(value)
+        return None
+
+    def _fingerprint_weak(self, value: BaseModel) -> str | None:
+        key = id(value)
+        with self._lock:
+            cached = self._weak.get(key)
+        if cached is not None and cached[0]() is value:
+            return cached[1]
+        if not _is_hashable(value):
+            return None
+        digest = _digest(value)
+
+        def forget(ref: weakref.ref) -> None:
+            with self._lock:
+                if self._weak.get(key, (None,))[0] is ref:
+                    del self._weak[key]
+
+        with self._lock:
+            self._weak[key] = (weakref.ref(value, forget), digest)
+        return digest
+
+    def _fingerprint_strong(self, value: Any) -> str | None:
+        key = id(value)
+        with self._lock:
+            cached = self._strong.get(key)
+            if cached is not None and cached[0] is value:
+                self._strong.move_to_end(key)
+                return cached[1]
+        if not _is_hashable(value):
+            return None
+        digest = _digest(value)
+        with self._lock:
+            self._strong[key] = (value, digest)
+            if len(self._strong) > self.maxsize:
+                self._strong.popitem(last=False)
+        return digest
+
+
+def _digest(value: Any) -> str:
+    return sha256(json.dumps(value, default=to_jsonable_python, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _is_hashable(value: Any) -> bool:
+    # Containers of mutable values (e.g. a tuple of lists, or a frozen model with a list field) are unhashable, and
+    # their contents may change between calls.
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
@@ -0,0 +1,28 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_scope: ContextVar[dict[tuple[Callable, str], Any] | None] = ContextVar("pydantic_cache_scope", default=None)
+
+
+@contextmanager
+def cache_scope() -> Iterator[None]:
+    """Memoize results of cached functions for the duration of the block.
+
+    Within the scope, repeated calls with the same arguments return the same object without consulting the backend.
+    Scopes are context-local, so concurrent tasks or threads each get their own. Nested scopes share the outermost
+    scope's results.
+    """
+    if _scope.get() is not None:
+        yield
+        return
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def get_scope() -> dict[tuple[Callable, str], Any] | None:
+    return _scope.get()
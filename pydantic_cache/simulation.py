@@ -0,0 +1,79 @@
+import heapq
+from collections import OrderedDict
+from collections.abc import Iterable
+
+
+class EvictionPolicy:
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+
+    def access(self, key: str) -> bool:
+        """Record an access to ``key``, returning whether it was a hit."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class LRU(EvictionPolicy):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._entries: OrderedDict[str, None] = OrderedDict()
+
+    def access(self, key: str) -> bool:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return True
+        self._entries[key] = None
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return False
+
+
+class FIFO(EvictionPolicy):
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._entries: OrderedDict[str, None] = OrderedDict()
+
+    def access(self, key: str) -> bool:
+        if key in self._entries:
+            return True
+        self._entries[key] = None
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return False
+
+
+class LFU(EvictionPolicy):
+    """Evict the least frequently used key, breaking ties by least recent use."""
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+        self._counts: dict[str, tuple[int, int]] = {}
+        self._heap: list[tuple[int, int, str]] = []
+        self._clock = 0
+
+    def access(self, key: str) -> bool:
+        self._clock += 1
+        hit = key in self._counts
+        count = self._counts[key][0] + 1 if hit else 1
+        self._counts[key] = (count, self._clock)
+        heapq.heappush(self._heap, (count, self._clock, key))
+        if len(self._counts) > self.capacity:
+            while True:
+                count, clock, candidate = heapq.heappop(self._heap)
+                # Skip heap items which are stale, i.e. superseded by a later access.
+                if self._counts.get(candidate) == (count, clock):
+                    del self._counts[candidate]
+                    break
+        return hit
+
+
+POLICIES: dict[str, type[EvictionPolicy]] = {"lru": LRU, "lfu": LFU, "fifo": FIFO}
+
+
+def simulate(trace: Iterable[str], capacity: int, policy: str = "lru") -> float:
+    """Replay an access trace against a cache of the given capacity, returning the hit rate."""
+    cache = POLICIES[policy](capacity)
+    hits = accesses = 0
+    for key in trace:
+        accesses += 1
+        hits += cache.access(key)
+    return hits / accesses if accesses else 0.0
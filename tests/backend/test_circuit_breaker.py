@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from pydantic_cache import AsyncBackend, Backend, cache
+from pydantic_cache.backend import AsyncCircuitBreakerBackend, CircuitBreakerBackend
+from pydantic_cache.backend.circuit_breaker import Circuit
+
+
+class FlakyBackend(Backend):
+    def __init__(self, delay: float = 0.0) -> None:
+        self._cache: dict[str, str] = {}
+        self.delay = delay
+        self.failing = False
+        self.calls = 0
+
+    def get(self, key: str) -> str:
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("Connection refused")
+        time.sleep(self.delay)
+        return self._cache[key]
+
+    def write(self, key: str, value: str) -> None:
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("Connection refused")
+        self._cache[key] = value
+
+
+class TestCircuitBreakerBackend:
+    @staticmethod
+    def should_compute_results_directly_when_backend_fails(caplog: pytest.LogCaptureFixture) -> None:
+        # GIVEN a cached function with a failing backend
+        backend = FlakyBackend()
+        backend.failing = True
+        side_effect = 0
+
+        @cache(CircuitBreakerBackend(backend))
+        def my_function(value: int) -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return value * 2
+
+        # WHEN I invoke the function
+        # THEN the result is computed without error
+        assert my_function(3) == 6
+        assert side_effect == 1
+
+        # AND the failures are logged
+        assert "Cache backend get failed" in caplog.text
+        assert "Cache backend write failed" in caplog.text
+
+    @staticmethod
+    def should_treat_slow_reads_as_misses() -> None:
+        # GIVEN a slow backend with a value already cached
+        backend = FlakyBackend(delay=0.05)
+        backend.write("foo", "bar")
+
+        # WHEN I read it with a latency budget shorter than the delay
+        breaker = CircuitBreakerBackend(backend, timeout=timedelta(milliseconds=5))
+
+        # THEN it is treated as a miss
+        with pytest.raises(KeyError):
+            breaker.get("foo")
+
+    @staticmethod
+    def should_bypass_backend_after_repeated_failures() -> None:
+        # GIVEN a failing backend behind a circuit breaker
+        backend = FlakyBackend()
+        backend.failing = True
+        breaker = CircuitBreakerBackend(backend, failure_threshold=2, cooldown=timedelta(milliseconds=50))
+
+        # WHEN it fails repeatedly
+        for _ in range(4):
+            with pytest.raises(KeyError):
+                breaker.get("foo")
+
+        # THEN the backend is bypassed once the threshold is reached
+        assert backend.calls == 2
+
+        # AND the backend is retried after the cool-down
+        backend.failing = False
+        backend.write("foo", "bar")
+        time.sleep(0.05)
+        assert breaker.get("foo") == "bar"
+
+    @staticmethod
+    def should_not_block_exit_on_hung_calls() -> None:
+        # GIVEN a backend which hangs on reads
+        backend = FlakyBackend(delay=0.5)
+        breaker = CircuitBreakerBackend(backend, timeout=timedelta(milliseconds=5))
+
+        # WHEN a read times out
+        with pytest.raises(KeyError):
+            breaker.get("foo")
+
+        # THEN the hung call is left running on a daemon thread, which won't be joined at exit
+        workers = [thread for thread in threading.enumerate() if thread.name.startswith("pydantic-cache-")]
+        assert workers
+        assert all(thread.daemon for thread in workers)
+
+
+class TestCircuit:
+    @staticmethod
+    def should_allow_a_single_probe_after_cooldown() -> None:
+        # GIVEN an open circuit
+        circuit = Circuit(failure_threshold=1, cooldown=timedelta(milliseconds=10))
+        circuit.record_failure()
+        assert not circuit.allow()
+
+        # WHEN the cool-down elapses
+        time.sleep(0.01)
+
+        # THEN only a single call is allowed through
+        assert circuit.allow()
+        assert not circuit.allow()
+
+        # AND if it fails, the circuit re-opens
+        circuit.record_failure()
+        assert not circuit.allow()
+
+        # AND if a later probe succeeds, the circuit closes
+        time.sleep(0.01)
+        assert circuit.allow()
+        circuit.record_success()
+        assert circuit.allow()
+        assert circuit.allow()
+
+
+class TestAsyncCircuitBreakerBackend:
+    @staticmethod
+    async def should_treat_failures_and_slow_reads_as_misses() -> None:
+        # GIVEN an asynchronous backend which hangs on reads and fails on writes
+        class HangingBackend(AsyncBackend):
+            async def get(self, key: str) -> str:
+                await asyncio.sleep(1)
+                raise AssertionError("Unreachable")  # pragma: no cover
+
+            async def write(self, key: str, value: str) -> None:
+                raise ConnectionError("Connection refused")
+
+        side_effect = 0
+
+        @cache(AsyncCircuitBreakerBackend(HangingBackend(), timeout=timedelta(milliseconds=5)))
+        async def my_function(value: int) -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return value * 2
+
+        # WHEN I invoke the function
+        # THEN the result is computed directly
+        assert await my_function(3) == 6
+        assert side_effect == 1
@@ -1,6 +1,8 @@
 from datetime import timedelta
 
+import pytest
 from fakeredis import FakeRedis
+from redis.exceptions import RedisClusterException
 
 from pydantic_cache import cache
 from pydantic_cache.backend import RedisBackend
@@ -25,3 +27,37 @@ class TestRedisBackend:
 
         # THEN the side effect should only trigger once
         assert side_effect == 1
+
+    @staticmethod
+    def should_prefix_keys_with_namespace():
+        # GIVEN a namespaced redis backend
+        redis = FakeRedis(decode_responses=True)
+        backend = RedisBackend(redis, ttl=timedelta(days=1), namespace="my-namespace")
+
+        # WHEN I write a value
+        backend.write("foo", "bar")
+
+        # THEN it is stored under the namespace
+        assert redis.keys() == ["my-namespace:foo"]
+        assert backend.get("foo") == "bar"
+        assert backend.get_many(["foo", "baz"]) == {"foo": "bar"}
+
+    @staticmethod
+    def should_batch_reads_per_slot_on_redis_cluster():
+        # GIVEN a redis cluster client, which rejects MGET across hash slots
+        class FakeRedisCluster(FakeRedis):
+            def mget(self, *args, **kwargs):
+                raise RedisClusterException("MGET - all keys must map to the same key slot")
+
+            def mget_nonatomic(self, keys):
+                return [self.get(key) for key in keys]
+
+        backend = RedisBackend(FakeRedisCluster(decode_responses=True), ttl=timedelta(days=1))
+        backend.write("foo", "1")
+        backend.write("bar", "2")
+
+        # WHEN I fetch several keys at once
+        # THEN they are fetched without a cross-slot MGET
+        assert backend.get_many(["foo", "bar", "baz"]) == {"foo": "1", "bar": "2"}
+        with pytest.raises(RedisClusterException):
+            backend.redis.mget(["foo", "bar"])
@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+import pytest
+from fakeredis import FakeRedis
+from redis.exceptions import ConnectionError
+
+from pydantic_cache import Backend, cache
+from pydantic_cache.backend import RedisBackend, ShardedBackend
+
+
+class MemoryBackend(Backend):
+    def __init__(self) -> None:
+        self._cache: dict[str, str] = {}
+        self.reads = 0
+
+    def get(self, key: str) -> str:
+        self.reads += 1
+        return self._cache[key]
+
+    def write(self, key: str, value: str) -> None:
+        self._cache[key] = value
+
+
+class TestShardedBackend:
+    @staticmethod
+    def should_cache_results_across_shards():
+        # GIVEN a function which caches results to several redis shards
+        side_effect = 0
+        shards = [RedisBackend(FakeRedis(), ttl=timedelta(days=1)) for _ in range(3)]
+
+        @cache(backend=ShardedBackend(shards))
+        def my_function(value: int) -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return value * 2
+
+        # WHEN I invoke the function twice for a range of arguments
+        for _ in range(2):
+            assert [my_function(value) for value in range(30)] == [value * 2 for value in range(30)]
+
+        # THEN the side effect should only trigger once per argument
+        assert side_effect == 30
+
+        # AND the results should be spread across every shard
+        assert all(shard.redis.dbsize() > 0 for shard in shards)
+
+    @staticmethod
+    def should_only_move_keys_to_new_shards_when_scaling_out():
+        # GIVEN a sharded backend
+        keys = [f"key-{index}" for index in range(1000)]
+        before = ShardedBackend([MemoryBackend() for _ in range(4)])
+
+        # WHEN a shard is added
+        after = ShardedBackend([MemoryBackend() for _ in range(5)])
+
+        # THEN keys either stay on the same shard or move to the new one
+        for key in keys:
+            assert after.shard_index(key) in (before.shard_index(key), 4)
+
+    @staticmethod
+    def should_colocate_keys_with_the_same_hash_tag():
+        backend = ShardedBackend([MemoryBackend() for _ in range(8)])
+        indexes = {backend.shard_index(f"user:{{42}}:{suffix}") for suffix in range(20)}
+        assert indexes == {backend.shard_index("42")}
+
+    @staticmethod
+    def should_colocate_hash_tagged_keys_across_namespaced_shards():
+        # GIVEN a sharded backend whose shards are namespaced redis backends
+        shards = [
+            RedisBackend(FakeRedis(decode_responses=True), ttl=timedelta(days=1), namespace="my-namespace")
+            for _ in range(4)
+        ]
+        backend = ShardedBackend(shards)
+
+        # WHEN I write several keys sharing a hash tag
+        keys = [f"user:{{42}}:{suffix}" for suffix in range(10)]
+        for key in keys:
+            backend.write(key, "value")
+
+        # THEN they are all stored, namespaced, on the shard chosen by the tag
+        shard = shards[backend.shard_index("42")]
+        assert sorted(shard.redis.keys()) == sorted(f"my-namespace:{key}" for key in keys)
+        assert backend.get_many(keys) == {key: "value" for key in keys}
+
+    @staticmethod
+    def should_fan_out_batched_reads_per_shard():
+        # GIVEN a sharded redis backend with some values written
+        shards = [RedisBackend(FakeRedis(decode_responses=True), ttl=timedelta(days=1)) for _ in range(3)]
+        backend = ShardedBackend(shards)
+        for index in range(10):
+            backend.write(f"key-{index}", str(index))
+
+        # WHEN I fetch several keys at once, including a miss
+        results = backend.get_many([f"key-{index}" for index in range(12)])
+
+        # THEN the hits are returned, and the miss is omitted
+        assert results == {f"key-{index}": str(index) for index in range(10)}
+
+    @staticmethod
+    def should_read_from_replicas_and_fall_back_to_primary():
+        # GIVEN a sharded backend with replicas, which have not yet received a write
+        primaries = [MemoryBackend(), MemoryBackend()]
+        replicas = [MemoryBackend(), MemoryBackend()]
+        backend = ShardedBackend(primaries, replicas=replicas)
+        backend.write("foo", "bar")
+        index = backend.shard_index("foo")
+
+        # WHEN I read the key
+        # THEN it is fetched from the primary
+        assert backend.get("foo") == "bar"
+        assert replicas[index].reads == 1
+        assert primaries[index].reads == 1
+
+        # AND once replicated, it is served by the replica alone
+        replicas[index].write("foo", "bar")
+        assert backend.get("foo") == "bar"
+        assert replicas[index].reads == 2
+        assert primaries[index].reads == 1
+
+    @staticmethod
+    def should_fall_back_to_primary_when_replica_fails(caplog: pytest.LogCaptureFixture):
+        # GIVEN a sharded backend whose replicas are unreachable
+        class UnreachableBackend(Backend):
+            def get(self, key: str) -> str:
+                raise ConnectionError("Connection refused")
+
+        primaries = [MemoryBackend(), MemoryBackend()]
+        backend = ShardedBackend(primaries, replicas=[UnreachableBackend(), UnreachableBackend()])
+        for index in range(10):
+            backend.write(f"key-{index}", str(index))
+
+        # WHEN I read keys individually and in a batch
+        # THEN they are served by the primaries
+        assert backend.get("key-0") == "0"
+        assert backend.get_many([f"key-{index}" for index in range(10)]) == {
+            f"key-{index}": str(index) for index in range(10)
+        }
+
+        # AND the replica failures are logged
+        assert "Replica get failed" in caplog.text
+        assert "Replica get_many failed" in caplog.text
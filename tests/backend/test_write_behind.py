@@ -0,0 +1,157 @@
+import gc
+import threading
+import time
+from collections.abc import Callable, Mapping
+from datetime import timedelta
+
+import pytest
+from fakeredis import FakeRedis
+
+from pydantic_cache import Backend, cache
+from pydantic_cache.backend import RedisBackend, WriteBehindBackend
+
+
+class BatchRecordingBackend(Backend):
+    def __init__(self) -> None:
+        self._cache: dict[str, str] = {}
+        self.batches: list[dict[str, str]] = []
+
+    def get(self, key: str) -> str:
+        return self._cache[key]
+
+    def write_many(self, items: Mapping[str, str]) -> None:
+        self.batches.append(dict(items))
+        self._cache.update(items)
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out waiting for condition"
+        time.sleep(0.001)
+
+
+class TestWriteBehindBackend:
+    @staticmethod
+    def should_serve_pending_writes_before_flushing() -> None:
+        # GIVEN a cached function with a write-behind backend
+        inner = BatchRecordingBackend()
+        backend = WriteBehindBackend(inner, flush_interval=timedelta(hours=1))
+        side_effect = 0
+
+        @cache(backend)
+        def my_function(value: int) -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return value * 2
+
+        # WHEN I invoke the function twice
+        assert my_function(3) == 6
+        assert my_function(3) == 6
+
+        # THEN the side effect should only trigger once
+        assert side_effect == 1
+
+        # AND nothing has been written to the underlying backend yet
+        assert inner.batches == []
+        backend.close()
+
+    @staticmethod
+    def should_coalesce_writes_into_batches() -> None:
+        # GIVEN a write-behind backend
+        inner = BatchRecordingBackend()
+        backend = WriteBehindBackend(inner, flush_interval=timedelta(hours=1))
+
+        # WHEN I write several values, including repeated keys
+        backend.write("a", "1")
+        backend.write("b", "2")
+        backend.write("a", "3")
+
+        # AND the backend is closed
+        backend.close()
+
+        # THEN the writes are flushed in a single coalesced batch
+        assert inner.batches == [{"a": "3", "b": "2"}]
+
+        # AND subsequent writes are passed straight through
+        backend.write("c", "4")
+        assert inner.batches[-1] == {"c": "4"}
+
+    @staticmethod
+    def should_flush_in_the_background_when_buffer_is_full() -> None:
+        # GIVEN a write-behind backend with a long flush interval
+        inner = BatchRecordingBackend()
+        backend = WriteBehindBackend(inner, max_pending=2, flush_interval=timedelta(hours=1))
+
+        # WHEN the buffer fills up
+        backend.write("a", "1")
+        assert inner.batches == []
+        backend.write("b", "2")
+
+        # THEN the background thread flushes it
+        wait_for(lambda: inner.batches == [{"a": "1", "b": "2"}])
+        backend.close()
+
+    @staticmethod
+    def should_log_failed_flushes(caplog: pytest.LogCaptureFixture) -> None:
+        # GIVEN a write-behind backend wrapping a failing backend
+        class FailingBackend(Backend):
+            def write_many(self, items: Mapping[str, str]) -> None:
+                raise ConnectionError("Connection refused")
+
+        backend = WriteBehindBackend(FailingBackend(), max_pending=1, flush_interval=timedelta(hours=1))
+
+        # WHEN a flush is triggered
+        # THEN the writer does not see the error
+        backend.write("a", "1")
+
+        # AND the failure is logged
+        wait_for(lambda: "Failed to flush 1 pending cache writes" in caplog.text)
+        backend.close()
+
+    @staticmethod
+    def should_stop_background_thread_once_garbage_collected() -> None:
+        # GIVEN a write-behind backend with a pending write
+        inner = BatchRecordingBackend()
+        backend = WriteBehindBackend(inner, flush_interval=timedelta(hours=1))
+        backend.write("a", "1")
+        assert any(thread.name == "pydantic-cache-write-behind" for thread in threading.enumerate())
+
+        # WHEN it is garbage collected
+        del backend
+        gc.collect()
+
+        # THEN the pending write is flushed
+        assert inner.batches == [{"a": "1"}]
+
+        # AND the background thread stops
+        assert not any(thread.name == "pydantic-cache-write-behind" for thread in threading.enumerate())
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"max_pending": 0}, "max_pending must be positive."),
+            ({"flush_interval": timedelta()}, "flush_interval must be positive."),
+        ],
+    )
+    def should_validate_arguments(kwargs: dict, message: str) -> None:
+        with pytest.raises(ValueError) as exc_info:
+            WriteBehindBackend(BatchRecordingBackend(), **kwargs)
+        assert str(exc_info.value) == message
+
+    @staticmethod
+    def should_flush_periodically_in_the_background() -> None:
+        # GIVEN a write-behind redis backend with a short flush interval
+        redis = FakeRedis(decode_responses=True)
+        backend = WriteBehindBackend(
+            RedisBackend(redis, ttl=timedelta(days=1)), flush_interval=timedelta(milliseconds=10)
+        )
+
+        # WHEN I write a value, and wait for longer than the interval
+        backend.write("foo", "bar")
+        time.sleep(0.1)
+
+        # THEN the value has been written to redis
+        assert redis.get("foo") == "bar"
+        backend.close()
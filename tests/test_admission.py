@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+import pytest
+
+from pydantic_cache import Backend, Doorkeeper, Entry, MaxSize, MinComputeDuration, cache
+
+
+class MemoryBackend(Backend):
+    def __init__(self) -> None:
+        self._cache: dict[str, str] = {}
+
+    def get(self, key: str) -> str:
+        return self._cache[key]
+
+    def write(self, key: str, value: str) -> None:
+        self._cache[key] = value
+
+
+def make_entry(value: str = "1", compute_duration: timedelta = timedelta()) -> Entry:
+    return Entry.create(value, compute_duration=compute_duration)
+
+
+class TestAdmission:
+    @staticmethod
+    def should_skip_caching_rejected_results() -> None:
+        # GIVEN a function which only caches small results
+        backend = MemoryBackend()
+        side_effect = 0
+
+        @cache(backend, admission=[MaxSize(10)])
+        def my_function(length: int) -> str:
+            nonlocal side_effect
+            side_effect += 1
+            return "a" * length
+
+        # WHEN I invoke it twice with a small result
+        my_function(1)
+        my_function(1)
+
+        # THEN the result is cached
+        assert side_effect == 1
+
+        # AND a large result is not cached
+        my_function(100)
+        my_function(100)
+        assert side_effect == 3
+        assert len(backend._cache) == 1
+
+    @staticmethod
+    def should_reject_results_computed_quickly() -> None:
+        policy = MinComputeDuration(timedelta(milliseconds=5))
+        assert not policy.admit("key", make_entry(compute_duration=timedelta(milliseconds=1)))
+        assert policy.admit("key", make_entry(compute_duration=timedelta(milliseconds=10)))
+
+    @staticmethod
+    def should_only_admit_keys_seen_before() -> None:
+        # GIVEN a doorkeeper
+        doorkeeper = Doorkeeper(capacity=100)
+        entry = make_entry()
+
+        # WHEN a key is seen for the first time
+        # THEN it is rejected
+        assert not doorkeeper.admit("foo", entry)
+
+        # AND it is admitted once seen again
+        assert doorkeeper.admit("foo", entry)
+
+        # AND other keys are still rejected
+        assert not doorkeeper.admit("bar", entry)
+
+    @staticmethod
+    def should_forget_sightings_once_capacity_is_reached() -> None:
+        doorkeeper = Doorkeeper(capacity=2)
+        entry = make_entry()
+        doorkeeper.admit("foo", entry)
+        doorkeeper.admit("bar", entry)
+        doorkeeper.admit("baz", entry)
+        assert not doorkeeper.admit("foo", entry)
+
+    @staticmethod
+    def should_require_positive_doorkeeper_capacity() -> None:
+        with pytest.raises(ValueError) as exc_info:
+            Doorkeeper(capacity=0)
+        assert str(exc_info.value) == "Capacity must be positive."
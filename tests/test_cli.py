@@ -0,0 +1,207 @@
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from fakeredis import FakeRedis
+from redis import Redis
+
+from pydantic_cache import DiskBackend, cache
+from pydantic_cache.backend import RedisBackend, TracingBackend
+from pydantic_cache.cli import main
+from pydantic_cache.simulation import simulate
+
+
+def rows(output: str) -> list[str]:
+    """Normalise whitespace in command output, dropping histogram bars."""
+    return [" ".join(word for word in line.split() if not word.startswith("#")) for line in output.splitlines()]
+
+
+class TestInspect:
+    @staticmethod
+    def should_summarise_disk_cache(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        # GIVEN a disk cache with some entries
+        @cache(DiskBackend(tmp_path, ttl=timedelta(days=1)), ttl=timedelta(hours=1))
+        def my_function(length: int) -> str:
+            return "a" * length
+
+        my_function(10)
+        my_function(2000)
+
+        # WHEN I inspect it
+        assert main(["inspect", "--disk", str(tmp_path)]) == 0
+
+        # THEN the entries are summarised
+        output = rows(capsys.readouterr().out)
+        assert "Entries: 2" in output
+        assert "< 1 KB 1" in output
+        assert "< 10 KB 1" in output
+        assert "< 1 minute 2" in output
+        assert "< 1 hour 2" in output
+
+    @staticmethod
+    def should_summarise_redis_namespace(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+        # GIVEN a redis cache with some entries in a namespace
+        redis = FakeRedis(decode_responses=True)
+        monkeypatch.setattr(Redis, "from_url", lambda url, **kwargs: redis)
+        redis.set("other", "value")
+
+        @cache(RedisBackend(redis, ttl=timedelta(days=1), namespace="my-namespace"))
+        def my_function(length: int) -> str:
+            return "a" * length
+
+        my_function(10)
+        my_function(20)
+
+        # WHEN I inspect the namespace
+        assert main(["inspect", "--redis", "redis://localhost", "--namespace", "my-namespace", "--top", "1"]) == 0
+
+        # THEN only entries in the namespace are summarised
+        output = capsys.readouterr().out
+        assert "Entries: 2" in rows(output)
+        assert "< 1 day 2" in rows(output)
+        assert "my-namespace" not in output
+        assert "other" not in output
+
+    @staticmethod
+    def should_skip_keys_not_written_by_cache(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+        # GIVEN a shared redis database containing a cache entry, a hash and an unrelated string
+        redis = FakeRedis(decode_responses=True)
+        monkeypatch.setattr(Redis, "from_url", lambda url, **kwargs: redis)
+        redis.hset("some-hash", "field", "value")
+        redis.set("some-string", "value")
+
+        @cache(RedisBackend(redis, ttl=timedelta(days=1)), ttl=timedelta(microseconds=1))
+        def my_function() -> int:
+            return 1
+
+        my_function()
+        time.sleep(0.001)
+
+        # WHEN I inspect the database, without a namespace
+        assert main(["inspect", "--redis", "redis://localhost"]) == 0
+
+        # THEN only the cache entry is reported
+        output = capsys.readouterr().out
+        assert "Entries: 1" in rows(output)
+        assert "some-" not in output
+
+        # AND pruning only deletes the cache entry
+        assert main(["prune", "--redis", "redis://localhost"]) == 0
+        assert "Pruned 1 expired entries." in capsys.readouterr().out
+        assert sorted(redis.keys()) == ["some-hash", "some-string"]
+
+
+class TestPrune:
+    @staticmethod
+    def should_delete_expired_entries_from_disk(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        # GIVEN a disk cache with an expired entry, and one which has not expired
+        @cache(DiskBackend(tmp_path, ttl=timedelta(days=1)), ttl=timedelta(microseconds=1))
+        def short_lived(a: int) -> int:
+            return a
+
+        @cache(DiskBackend(tmp_path, ttl=timedelta(days=1)))
+        def long_lived(b: int) -> int:
+            return b
+
+        short_lived(1)
+        long_lived(2)
+        time.sleep(0.001)
+
+        # WHEN I prune the cache
+        assert main(["prune", "--disk", str(tmp_path)]) == 0
+
+        # THEN only the expired entry is deleted
+        assert "Pruned 1 expired entries." in capsys.readouterr().out
+        assert len(list(tmp_path.iterdir())) == 1
+
+    @staticmethod
+    def should_delete_expired_entries_from_redis(
+        monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+    ) -> None:
+        # GIVEN a redis cache with an entry which has expired, but not yet been evicted by redis
+        redis = FakeRedis(decode_responses=True)
+        monkeypatch.setattr(Redis, "from_url", lambda url, **kwargs: redis)
+
+        @cache(RedisBackend(redis, ttl=timedelta(days=1), namespace="my-namespace"), ttl=timedelta(microseconds=1))
+        def short_lived(a: int) -> int:
+            return a
+
+        # AND one which has not expired
+        @cache(RedisBackend(redis, ttl=timedelta(days=1), namespace="my-namespace"))
+        def long_lived(b: int) -> int:
+            return b
+
+        short_lived(1)
+        long_lived(2)
+        time.sleep(0.001)
+
+        # WHEN I inspect the cache
+        assert main(["inspect", "--redis", "redis://localhost", "--namespace", "my-namespace"]) == 0
+
+        # THEN the expired entry is reported
+        output = rows(capsys.readouterr().out)
+        assert "expired 1" in output
+        assert "< 1 day 1" in output
+
+        # AND pruning deletes only the expired entry
+        assert main(["prune", "--redis", "redis://localhost", "--namespace", "my-namespace"]) == 0
+        assert "Pruned 1 expired entries." in capsys.readouterr().out
+        assert redis.dbsize() == 1
+
+    @staticmethod
+    def should_reject_ttl_for_redis(capsys: pytest.CaptureFixture) -> None:
+        with pytest.raises(SystemExit):
+            main(["prune", "--redis", "redis://localhost", "--ttl", "60"])
+        assert "--ttl only applies to --disk" in capsys.readouterr().err
+
+
+class TestSimulate:
+    @staticmethod
+    def should_replay_recorded_trace(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+        # GIVEN a trace recorded from a cached function
+        trace = tmp_path / "trace.txt"
+
+        backend = TracingBackend(DiskBackend(tmp_path, ttl=timedelta(days=1)), trace)
+
+        @cache(backend)
+        def my_function(value: int) -> int:
+            return value
+
+        for value in [1, 2, 1, 3, 1, 2]:
+            my_function(value)
+        backend.close()
+
+        # AND reads after closing are no longer recorded
+        my_function(4)
+        assert len(trace.read_text().split()) == 6
+
+        # WHEN I simulate the trace with different capacities
+        assert main(["simulate", str(trace), "--capacity", "1", "3", "--policy", "lru", "lfu"]) == 0
+
+        # THEN the hit rates are reported
+        output = rows(capsys.readouterr().out)
+        assert "lru 1 0.0%" in output
+        assert "lru 3 50.0%" in output
+        assert "lfu 1 0.0%" in output
+
+    @staticmethod
+    @pytest.mark.parametrize("capacity", ["0", "-1"])
+    def should_reject_non_positive_capacity(tmp_path: Path, capacity: str, capsys: pytest.CaptureFixture) -> None:
+        trace = tmp_path / "trace.txt"
+        trace.write_text("a\n")
+        with pytest.raises(SystemExit):
+            main(["simulate", str(trace), "--capacity", capacity])
+        assert "must be a positive integer" in capsys.readouterr().err
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "policy, expected",
+        [
+            ("lru", 2 / 6),
+            ("fifo", 1 / 6),
+            ("lfu", 2 / 6),
+        ],
+    )
+    def should_simulate_eviction_policies(policy: str, expected: float) -> None:
+        assert simulate(["a", "b", "a", "c", "a", "b"], capacity=2, policy=policy) == pytest.approx(expected)
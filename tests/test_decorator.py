@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 from pydantic import BaseModel
 
-from pydantic_cache import AsyncBackend, DiskBackend, PydanticCacheError, cache, disk_cache
+from pydantic_cache import AsyncBackend, Backend, DiskBackend, Entry, PydanticCacheError, cache, disk_cache
 
 
 class TestDiskCache:
@@ -260,3 +260,75 @@ class TestCache:
 
         # THEN an informative error is raised
         assert str(exc_info.value) == "Can't use an async cache backend on a synchronous function."
+
+    @staticmethod
+    def should_store_entries_with_metadata() -> None:
+        # GIVEN a cached function
+        class MemoryBackend(Backend):
+            def __init__(self):
+                self._cache = {}
+
+            def get(self, key: str) -> str:
+                return self._cache[key]
+
+            def write(self, key: str, value: str) -> None:
+                self._cache[key] = value
+
+        backend = MemoryBackend()
+
+        @cache(backend=backend, ttl=timedelta(hours=1))
+        def my_function(value: int) -> list[int]:
+            time.sleep(0.001)
+            return [value] * 2
+
+        # WHEN I invoke the function
+        assert my_function(3) == [3, 3]
+
+        # THEN the result is stored with metadata
+        (raw,) = backend._cache.values()
+        assert raw.endswith(',"value":[3, 3]}')
+        entry = Entry.loads(raw)
+        assert entry.value == [3, 3]
+        assert entry.size == 6
+        assert entry.expires_at == entry.created_at + timedelta(hours=1)
+        assert entry.compute_duration >= timedelta(milliseconds=1)
+
+    @staticmethod
+    def should_respect_function_ttl(tmp_path: Path) -> None:
+        # GIVEN a function with a shorter ttl than its backend
+        side_effect = 0
+
+        @cache(backend=DiskBackend(tmp_path, ttl=timedelta(days=1)), ttl=timedelta(microseconds=1))
+        def my_function(value: int) -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return value * 2
+
+        # WHEN I invoke the function twice, with longer interval than the TTL
+        assert my_function(2) == 4
+        time.sleep(0.001)
+        assert my_function(2) == 4
+
+        # THEN the side effect should be triggered twice
+        assert side_effect == 2
+
+    @staticmethod
+    def should_treat_unrecognised_entries_as_misses(tmp_path: Path) -> None:
+        # GIVEN a cache containing a bare value, as written by an earlier version
+        backend = DiskBackend(tmp_path, ttl=timedelta(days=1))
+        side_effect = 0
+
+        @cache(backend=backend)
+        def my_function() -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return 2
+
+        my_function()
+        (path,) = tmp_path.iterdir()
+        backend.write(path.stem, "1")
+
+        # WHEN I invoke the function
+        # THEN the result is recomputed
+        assert my_function() == 2
+        assert side_effect == 2
@@ -0,0 +1,120 @@
+import gc
+from unittest.mock import patch
+
+from pydantic import BaseModel, ConfigDict
+
+from pydantic_cache import Backend, cache
+from pydantic_cache import fingerprint as fingerprint_module
+from pydantic_cache.fingerprint import ArgumentFingerprints
+
+
+class MemoryBackend(Backend):
+    def __init__(self) -> None:
+        self._cache: dict[str, str] = {}
+
+    def get(self, key: str) -> str:
+        return self._cache[key]
+
+    def write(self, key: str, value: str) -> None:
+        self._cache[key] = value
+
+
+class Config(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    values: tuple[int, ...]
+
+
+class MutableConfig(BaseModel):
+    values: list[int]
+
+
+class FrozenConfigWithList(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    values: list[int]
+
+
+class TestArgumentFingerprints:
+    @staticmethod
+    def should_reuse_digests_of_immutable_arguments() -> None:
+        # GIVEN a function which memoizes argument fingerprints
+        side_effect = 0
+
+        @cache(MemoryBackend(), memoize_arguments=True)
+        def my_function(config: Config, name: str, scale: int) -> int:
+            nonlocal side_effect
+            side_effect += 1
+            return sum(config.values) * scale
+
+        config = Config(values=tuple(range(1000)))
+        name = "a" * 1000
+
+        # WHEN I invoke it repeatedly with the same objects
+        with patch.object(fingerprint_module, "_digest", wraps=fingerprint_module._digest) as digest:
+            assert my_function(config, name, 1) == 499500
+            assert my_function(config, name, 1) == 499500
+            assert my_function(config, name, 2) == 999000
+
+        # THEN each immutable argument is only serialized once
+        assert digest.call_count == 2
+
+        # AND results are cached as normal
+        assert side_effect == 2
+
+        # AND equal, but distinct, arguments hit the same cache entry
+        assert my_function(Config(values=tuple(range(1000))), "a" * 1000, 1) == 499500
+        assert side_effect == 2
+
+    @staticmethod
+    def should_not_memoize_mutable_arguments() -> None:
+        fingerprints = ArgumentFingerprints()
+        assert fingerprints.fingerprint(MutableConfig(values=[1])) is None
+        assert fingerprints.fingerprint([1, 2, 3]) is None
+        assert fingerprints.fingerprint(([1],)) is None
+        assert fingerprints.fingerprint(FrozenConfigWithList(values=[1])) is None
+
+    @staticmethod
+    def should_not_memoize_immutable_containers_of_mutable_values() -> None:
+        # GIVEN a function which memoizes argument fingerprints
+        @cache(MemoryBackend(), memoize_arguments=True)
+        def my_function(values: tuple[list[int], ...], config: FrozenConfigWithList) -> int:
+            return sum(values[0]) + sum(config.values)
+
+        # AND it has been invoked with immutable containers of mutable values
+        values = ([1],)
+        config = FrozenConfigWithList(values=[0])
+        assert my_function(values, config) == 1
+
+        # WHEN the contents are mutated
+        values[0].append(100)
+        config.values.append(1000)
+
+        # THEN the result reflects the new contents
+        assert my_function(values, config) == 1101
+
+    @staticmethod
+    def should_forget_models_once_garbage_collected() -> None:
+        # GIVEN a memoized fingerprint for a frozen model
+        fingerprints = ArgumentFingerprints()
+        config = Config(values=(1, 2, 3))
+        digest = fingerprints.fingerprint(config)
+        assert len(fingerprints._weak) == 1
+
+        # WHEN the model is garbage collected
+        del config
+        gc.collect()
+
+        # THEN it is forgotten
+        assert len(fingerprints._weak) == 0
+
+        # AND a different model with the same content has the same digest
+        assert fingerprints.fingerprint(Config(values=(1, 2, 3))) == digest
+
+    @staticmethod
+    def should_bound_strongly_held_arguments() -> None:
+        fingerprints = ArgumentFingerprints(maxsize=2)
+        values = [str(index) * 10 for index in range(3)]
+        for value in values:
+            fingerprints.fingerprint(value)
+        assert [value for value, _ in fingerprints._strong.values()] == values[1:]
@@ -0,0 +1,104 @@
+import asyncio
+
+from pydantic import BaseModel
+
+from pydantic_cache import Backend, cache, cache_scope
+
+
+class CountingBackend(Backend):
+    def __init__(self) -> None:
+        self._cache: dict[str, str] = {}
+        self.reads = 0
+
+    def get(self, key: str) -> str:
+        self.reads += 1
+        return self._cache[key]
+
+    def write(self, key: str, value: str) -> None:
+        self._cache[key] = value
+
+
+class Model(BaseModel):
+    value: int
+
+
+class TestCacheScope:
+    @staticmethod
+    def should_memoize_results_within_scope() -> None:
+        # GIVEN a cached function
+        backend = CountingBackend()
+
+        @cache(backend)
+        def my_function(value: int) -> Model:
+            return Model(value=value)
+
+        # AND a value already in the cache
+        my_function(1)
+        assert backend.reads == 1
+
+        # WHEN I invoke the function repeatedly within a scope
+        with cache_scope():
+            first = my_function(1)
+            second = my_function(1)
+
+        # THEN the backend is only consulted once
+        assert backend.reads == 2
+
+        # AND the same object is returned
+        assert first is second
+
+        # AND the backend is consulted again outside of the scope
+        assert my_function(1) == first
+        assert backend.reads == 3
+
+    @staticmethod
+    def should_not_share_results_between_functions() -> None:
+        @cache(CountingBackend())
+        def double(value: int) -> int:
+            return value * 2
+
+        @cache(CountingBackend())
+        def triple(value: int) -> int:
+            return value * 3
+
+        with cache_scope():
+            assert double(2) == 4
+            assert triple(2) == 6
+
+    @staticmethod
+    def should_share_results_with_nested_scopes() -> None:
+        backend = CountingBackend()
+
+        @cache(backend)
+        def my_function(value: int) -> int:
+            return value
+
+        with cache_scope():
+            my_function(1)
+            with cache_scope():
+                my_function(1)
+            my_function(1)
+
+        assert backend.reads == 1
+
+    @staticmethod
+    async def should_isolate_concurrent_tasks() -> None:
+        # GIVEN an asynchronous cached function
+        backend = CountingBackend()
+
+        @cache(backend)
+        async def my_function(value: int) -> int:
+            return value
+
+        # AND a task which invokes the function twice within its own scope
+        async def task() -> None:
+            with cache_scope():
+                await my_function(1)
+                await asyncio.sleep(0)
+                await my_function(1)
+
+        # WHEN I run two tasks concurrently
+        await asyncio.gather(task(), task())
+
+        # THEN each task consults the backend once
+        assert backend.reads == 2